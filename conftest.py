@@ -0,0 +1,10 @@
+"""
+Shared pytest configuration for the Spring Actuator Checker tests
+"""
+
+import os
+import sys
+
+# Add the project directory to the path once per session so the tests can
+# import spring_actuator_checker
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -6,27 +6,83 @@ API health, and request/response contracts.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 import json
+import math
+import os
 import time
+import atexit
 import logging
-from typing import Dict, List, Optional, Any
+import logging.handlers
+import heapq
+import queue
+import threading
+from array import array
+from functools import partial
+from typing import Dict, List, Optional, Any, Callable, Iterator, Tuple, Union
 from dataclasses import dataclass
 from datetime import datetime
 import argparse
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+
+def _configure_logging() -> None:
+    """
+    Configure logging to the console and, through a background thread, to file
+
+    Check methods only put file records on a queue; a QueueListener thread
+    does the file I/O, so disk writes never block or serialize requests.
+    Console output stays synchronous so it keeps its order relative to the
+    results main() prints to the same stdout.
+    Like logging.basicConfig, this does nothing if the root logger already
+    has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.handlers.RotatingFileHandler(
+        'spring_actuator_checker.log',
+        maxBytes=10_000_000,
+        backupCount=3,
+        delay=True
+    )
+    console_handler = logging.StreamHandler(sys.stdout)
+    file_handler.setFormatter(formatter)
+    console_handler.setFormatter(formatter)
+
+    log_queue = queue.Queue(-1)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.addHandler(console_handler)
+    root.setLevel(logging.INFO)
+
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+
+    # Per-connection chatter from the HTTP stack is noise even in verbose mode
+    logging.getLogger('requests').setLevel(logging.WARNING)
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
 
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('spring_actuator_checker.log'),
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+_configure_logging()
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Chunk size used when buffering streamed response bodies
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Methods whose identical in-flight requests may share a single response
+_COALESCED_METHODS = frozenset({'GET', 'HEAD'})
+
+# Slotted dataclasses (no per-instance __dict__) are only available on Python 3.10+
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_OPTIONS)
 class APICheckResult:
     """Data class to store API check results"""
     endpoint: str
@@ -37,7 +93,7 @@ class APICheckResult:
     response_body: Optional[Dict] = None
     error_message: Optional[str] = None
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ModuleHealthStatus:
     """Data class to store module health status"""
     module_name: str
@@ -47,10 +103,143 @@ class ModuleHealthStatus:
     deployment_status: str
     timestamp: datetime
 
+class BatchResults:
+    """
+    Column-oriented results of a batch of API checks
+
+    Numeric fields are kept in compact typed arrays so aggregate statistics
+    do not have to walk one APICheckResult object per check. Individual
+    APICheckResult objects are only built when indexed or iterated. The
+    wall-clock time is recorded once for the whole batch in started_at.
+    """
+
+    def __init__(self, size: int):
+        """
+        Preallocate storage for a batch
+
+        Args:
+            size: Number of checks in the batch
+        """
+        self.started_at = datetime.now()
+        self.endpoints: List[Optional[str]] = [None] * size
+        self.methods: List[Optional[str]] = [None] * size
+        self.status_codes = array('i', [0]) * size
+        self.response_times = array('d', [0.0]) * size
+        self.success = array('b', [0]) * size
+        self.response_bodies: List[Optional[Dict]] = [None] * size
+        self.error_messages: List[Optional[str]] = [None] * size
+
+    def set(self, index: int, result: APICheckResult) -> None:
+        """Store a single check result at the given position"""
+        self.endpoints[index] = result.endpoint
+        self.methods[index] = result.method
+        self.status_codes[index] = result.status_code
+        self.response_times[index] = result.response_time
+        self.success[index] = result.success
+        self.response_bodies[index] = result.response_body
+        self.error_messages[index] = result.error_message
+
+    def __len__(self) -> int:
+        return len(self.endpoints)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[APICheckResult, List[APICheckResult]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return APICheckResult(
+            endpoint=self.endpoints[index],
+            method=self.methods[index],
+            status_code=self.status_codes[index],
+            response_time=self.response_times[index],
+            success=bool(self.success[index]),
+            response_body=self.response_bodies[index],
+            error_message=self.error_messages[index]
+        )
+
+    def __iter__(self) -> Iterator[APICheckResult]:
+        return self.to_objects()
+
+    def to_objects(self) -> Iterator[APICheckResult]:
+        """Lazily yield an APICheckResult per check, in batch order"""
+        for index in range(len(self)):
+            yield self[index]
+
+    def success_rate(self) -> float:
+        """Fraction of checks that succeeded"""
+        if not self.success:
+            return 0.0
+        return sum(self.success) / len(self.success)
+
+    def percentile(self, percent: float) -> float:
+        """
+        Response time at the given percentile (nearest-rank)
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Response time in seconds
+        """
+        if not self.response_times:
+            raise ValueError("percentile of an empty batch")
+        ordered = sorted(self.response_times)
+        rank = max(math.ceil(percent / 100 * len(ordered)), 1)
+        return ordered[rank - 1]
+
+    def p50(self) -> float:
+        """Median response time in seconds"""
+        return self.percentile(50)
+
+    def p99(self) -> float:
+        """99th percentile response time in seconds"""
+        return self.percentile(99)
+
+    def slowest(self, k: int = 5) -> List[Tuple[str, float]]:
+        """
+        The k slowest checks
+
+        Args:
+            k: Number of checks to return
+
+        Returns:
+            (endpoint, response_time) pairs, slowest first
+        """
+        indices = heapq.nlargest(k, range(len(self)), key=self.response_times.__getitem__)
+        return [(self.endpoints[i], self.response_times[i]) for i in indices]
+
+def _validate_schema(body: Dict[str, Any], schema: Dict[str, Any], errors: List[str],
+                     prefix: str = "") -> None:
+    """
+    Check a decoded response body against an expected response schema
+
+    Schema values are type names as reported by type(value).__name__
+    ("str", "int", "list", ...) or nested schemas for object fields.
+
+    Args:
+        body: Decoded JSON object to check
+        schema: Expected response schema
+        errors: List to append an error message to for every violation
+        prefix: Dotted path of the enclosing field, used in error messages
+    """
+    for key, expected in schema.items():
+        if key not in body:
+            errors.append(f"Missing expected field: {prefix}{key}")
+            continue
+        value = body[key]
+        nested = isinstance(expected, dict)
+        expected_type = "dict" if nested else expected
+        actual_type = type(value).__name__
+        if actual_type != expected_type:
+            errors.append(f"Type mismatch for {prefix}{key}: expected {expected_type}, got {actual_type}")
+        elif nested:
+            _validate_schema(value, expected, errors, f"{prefix}{key}.")
+
 class SpringActuatorChecker:
     """Main class for checking Spring Boot application health and APIs"""
 
-    def __init__(self, base_url: str, timeout: int = 30, verify_ssl: bool = True):
+    def __init__(self, base_url: str, timeout: int = 30, verify_ssl: bool = True,
+                 pool_maxsize: int = 64, cache_ttl: Optional[float] = None,
+                 max_body_bytes: int = 1024 * 1024,
+                 session: Optional[requests.Session] = None):
         """
         Initialize the checker with base URL and configuration
 
@@ -58,181 +247,402 @@ class SpringActuatorChecker:
             base_url: Base URL of the Spring Boot application
             timeout: Request timeout in seconds
             verify_ssl: Whether to verify SSL certificates
+            pool_maxsize: Maximum number of keep-alive connections per host,
+                which also caps how many requests check_many runs at once
+            cache_ttl: Seconds to reuse successful actuator health/info results;
+                defaults to the HEALTH_CACHE_TTL environment variable or 10,
+                and 0 disables caching
+            max_body_bytes: Maximum number of response body bytes to read;
+                larger bodies are not decoded
+            session: Existing session to send requests through; it is used
+                as-is and left open by close(). By default the checker builds
+                and owns a pooled session
         """
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
         self.verify_ssl = verify_ssl
-        self.session = requests.Session()
+        self.pool_maxsize = pool_maxsize
+        self.cache_ttl = float(os.getenv('HEALTH_CACHE_TTL', '10')) if cache_ttl is None else cache_ttl
+        self.max_body_bytes = max_body_bytes
+
+        # Actuator URLs never change for a checker, so build them once
+        self._health_url = f"{self.base_url}/actuator/health"
+        self._info_url = f"{self.base_url}/actuator/info"
+        self._fetch_actuator_health = partial(
+            self._execute, 'GET', self._health_url, "Actuator health", actuator=True
+        )
+        self._fetch_actuator_info = partial(
+            self._execute, 'GET', self._info_url, "Actuator info", actuator=True
+        )
 
-        # Common headers for Spring Boot applications
-        self.session.headers.update({
+        # Successful actuator results keyed by URL
+        self._cache: Dict[str, Tuple[float, APICheckResult]] = {}
+        self._cache_lock = threading.Lock()
+
+        # Requests currently in flight, so identical concurrent checks can
+        # wait for the same response instead of issuing duplicate requests
+        self._inflight: Dict[Any, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        self._owns_session = session is None
+        self.session = self._build_session() if session is None else session
+
+    def _build_session(self) -> requests.Session:
+        """Create the pooled session used when none is injected"""
+        session = requests.Session()
+
+        # Keep enough pooled keep-alive connections for concurrent checks, and
+        # retry gateway errors with a short backoff. Connection failures are
+        # not retried, so an unreachable application costs a single timeout.
+        # Retry-After is ignored so a 503 (how Spring reports a DOWN app) or
+        # 429 is never retried or slept on, however long the server asks for
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=Retry(
+                total=2,
+                connect=0,
+                read=0,
+                backoff_factor=0.2,
+                status_forcelist=(502, 504),
+                respect_retry_after_header=False,
+                raise_on_status=False
+            )
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        # Common headers for Spring Boot applications. Accept-Encoding lists
+        # every compression urllib3 can decode here, including brotli and
+        # zstd when their optional packages are installed
+        session.headers.update({
+            'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Content-Type': 'application/json',
             'User-Agent': 'Spring-Actuator-Checker/1.0'
         })
+        return session
 
-    def check_actuator_health(self) -> APICheckResult:
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections"""
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> 'SpringActuatorChecker':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _single_flight(self, key: Any, fetch: Callable[[], APICheckResult]) -> APICheckResult:
         """
-        Check the Spring Boot Actuator health endpoint
+        Run fetch, unless an identical request is already in flight
+
+        Callers arriving while a request for the same key is running wait for
+        and share its result (or exception) instead of sending their own.
+
+        Args:
+            key: Hashable identity of the request
+            fetch: Callable performing the actual check
 
         Returns:
-            APICheckResult with health check details
+            APICheckResult shared by all concurrent callers for key
         """
-        endpoint = f"{self.base_url}/actuator/health"
-        logger.info(f"Checking actuator health endpoint: {endpoint}")
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = self._inflight[key] = Future()
+
+        if not is_leader:
+            logger.debug("Joining in-flight request for %s", key)
+            return future.result()
 
-        start_time = time.time()
         try:
-            response = self.session.get(
-                endpoint,
-                timeout=self.timeout,
-                verify=self.verify_ssl
-            )
-            response_time = time.time() - start_time
+            result = fetch()
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _cached(self, key: str, fetch: Callable[[], APICheckResult]) -> APICheckResult:
+        """
+        Return a fresh cached result for key, or fetch and cache a new one
 
-            success = response.status_code == 200
-            result = APICheckResult(
-                endpoint=endpoint,
-                method="GET",
-                status_code=response.status_code,
-                response_time=response_time,
-                success=success,
-                response_body=response.json() if success else None,
-                error_message=None if success else f"HTTP {response.status_code}: {response.text}"
-            )
+        Only successful results are cached. Concurrent refreshes of the same
+        key share a single request.
 
-            logger.info(f"Health check completed - Status: {response.status_code}, Time: {response_time:.2f}s")
+        Args:
+            key: Cache key (the endpoint URL)
+            fetch: Callable performing the actual check
+
+        Returns:
+            Cached or newly fetched APICheckResult
+        """
+        if self.cache_ttl <= 0:
+            return self._single_flight(key, fetch)
+
+        with self._cache_lock:
+            hit = self._cache.get(key)
+        if hit and time.monotonic() - hit[0] < self.cache_ttl:
+            logger.debug("Using cached result for %s", key)
+            return hit[1]
+
+        def refresh() -> APICheckResult:
+            result = fetch()
+            if result.success:
+                with self._cache_lock:
+                    self._cache[key] = (time.monotonic(), result)
             return result
 
-        except requests.exceptions.RequestException as e:
-            response_time = time.time() - start_time
-            logger.error(f"Health check failed: {str(e)}")
-            return APICheckResult(
-                endpoint=endpoint,
-                method="GET",
-                status_code=0,
-                response_time=response_time,
-                success=False,
-                error_message=str(e)
-            )
+        return self._single_flight(key, refresh)
 
-    def check_actuator_info(self) -> APICheckResult:
+    def clear_cache(self) -> None:
+        """Drop all cached actuator results"""
+        with self._cache_lock:
+            self._cache.clear()
+
+    def _read_body(self, response: requests.Response) -> bool:
         """
-        Check the Spring Boot Actuator info endpoint
+        Buffer a streamed response body, reading at most max_body_bytes
+
+        The buffered bytes become the response content, so json() and text
+        never see more than max_body_bytes.
+
+        Args:
+            response: Response requested with stream=True
 
         Returns:
-            APICheckResult with info details
+            True if the whole body fit within max_body_bytes
+        """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=_READ_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > self.max_body_bytes:
+                logger.warning("Response body from %s exceeds %d bytes; not decoding it",
+                               response.url, self.max_body_bytes)
+                break
+        response._content = b"".join(chunks)[:self.max_body_bytes]
+        return size <= self.max_body_bytes
+
+    @staticmethod
+    def _safe_json(response: requests.Response) -> Optional[Any]:
         """
-        endpoint = f"{self.base_url}/actuator/info"
-        logger.info(f"Checking actuator info endpoint: {endpoint}")
+        Decode a response body as JSON without raising
+
+        Args:
+            response: Response whose body should be decoded
 
-        start_time = time.time()
+        Returns:
+            Decoded body, or None if the body is empty or not JSON
+        """
+        if not response.content:
+            return None
         try:
-            response = self.session.get(
-                endpoint,
-                timeout=self.timeout,
-                verify=self.verify_ssl
-            )
-            response_time = time.time() - start_time
+            return response.json()
+        except ValueError:
+            # The preview decodes the whole body even with lazy formatting,
+            # so only build it when the warning will actually be emitted
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning("Response is not JSON: %s...", response.text[:200])
+            return None
 
-            success = response.status_code == 200
-            result = APICheckResult(
-                endpoint=endpoint,
-                method="GET",
-                status_code=response.status_code,
-                response_time=response_time,
-                success=success,
-                response_body=response.json() if success else None,
-                error_message=None if success else f"HTTP {response.status_code}: {response.text}"
-            )
+    def check_actuator_health(self) -> APICheckResult:
+        """
+        Check the Spring Boot Actuator health endpoint
 
-            logger.info(f"Info check completed - Status: {response.status_code}, Time: {response_time:.2f}s")
-            return result
+        Successful results are reused for cache_ttl seconds.
 
-        except requests.exceptions.RequestException as e:
-            response_time = time.time() - start_time
-            logger.error(f"Info check failed: {str(e)}")
-            return APICheckResult(
-                endpoint=endpoint,
-                method="GET",
-                status_code=0,
-                response_time=response_time,
-                success=False,
-                error_message=str(e)
-            )
+        Returns:
+            APICheckResult with health check details
+        """
+        return self._cached(self._health_url, self._fetch_actuator_health)
+
+    def check_actuator_info(self) -> APICheckResult:
+        """
+        Check the Spring Boot Actuator info endpoint
+
+        Successful results are reused for cache_ttl seconds.
+
+        Returns:
+            APICheckResult with info details
+        """
+        return self._cached(self._info_url, self._fetch_actuator_info)
 
     def check_custom_api(self, endpoint: str, method: str = "GET",
                         headers: Optional[Dict[str, str]] = None,
                         json_data: Optional[Dict] = None,
-                        expected_status: int = 200) -> APICheckResult:
+                        expected_status: int = 200,
+                        parse_body: bool = True) -> APICheckResult:
         """
         Check a custom API endpoint
 
+        Concurrent identical GET/HEAD checks share a single request.
+
         Args:
             endpoint: API endpoint (relative to base_url)
             method: HTTP method (GET, POST, PUT, DELETE, etc.)
             headers: Additional headers to send
             json_data: JSON data to send in request body
             expected_status: Expected HTTP status code
+            parse_body: Whether to decode the JSON response body; when False
+                response_body is always None
 
         Returns:
             APICheckResult with API check details
         """
-        full_url = f"{self.base_url}{endpoint}" if not endpoint.startswith('http') else endpoint
-        logger.info(f"Checking API endpoint: {full_url} ({method})")
+        full_url = endpoint if endpoint.startswith('http') else self.base_url + endpoint
+        method = method.upper()
 
-        start_time = time.time()
+        def fetch() -> APICheckResult:
+            return self._execute(method, full_url, "API", expected_status=expected_status,
+                                 headers=headers, json_data=json_data, parse_body=parse_body)
 
-        # Prepare request headers
-        request_headers = {}
-        if headers:
-            request_headers.update(headers)
+        # Only safe methods are coalesced; two POSTs are two operations
+        if method not in _COALESCED_METHODS:
+            return fetch()
 
+        # Most checks send neither extra headers nor a body, so only pay for
+        # adding them to the key when they are present. A request whose key
+        # cannot be built (e.g. a body that is not JSON-serializable) is sent
+        # on its own and left for requests to accept or reject
         try:
+            key = (
+                method,
+                full_url,
+                tuple(sorted(headers.items())) if headers else None,
+                json.dumps(json_data, sort_keys=True) if json_data is not None else None,
+                expected_status,
+                parse_body
+            )
+            hash(key)
+        except (TypeError, ValueError):
+            return fetch()
+        return self._single_flight(key, fetch)
+
+    def _execute(self, method: str, url: str, label: str,
+                 expected_status: int = 200,
+                 headers: Optional[Dict[str, str]] = None,
+                 json_data: Optional[Dict] = None,
+                 parse_body: bool = True,
+                 actuator: bool = False) -> APICheckResult:
+        """
+        Perform a single check request and turn the outcome into a result
+
+        Args:
+            method: Upper-case HTTP method
+            url: Full URL to request
+            label: Name of the check used in log messages
+            expected_status: HTTP status code that counts as success
+            headers: Additional headers to send
+            json_data: JSON data to send in request body
+            parse_body: Whether to decode the JSON response body
+            actuator: Actuator endpoints must answer with JSON, so a success
+                with an undecodable or oversized body fails the check, and
+                failures report the response text
+
+        Returns:
+            APICheckResult with check details
+        """
+        logger.info("Checking %s endpoint: %s (%s)", label, url, method)
+
+        start_time = time.perf_counter()
+        try:
+            # Extra headers are merged over the session defaults by requests
             response = self.session.request(
-                method=method.upper(),
-                url=full_url,
-                headers=request_headers,
+                method=method,
+                url=url,
+                headers=headers,
                 json=json_data,
+                stream=True,
                 timeout=self.timeout,
                 verify=self.verify_ssl
             )
-            response_time = time.time() - start_time
-
-            # Check if response status matches expected
-            success = response.status_code == expected_status
-
-            # Try to parse JSON response
-            response_body = None
             try:
-                response_body = response.json()
-            except json.JSONDecodeError:
-                logger.warning(f"Response is not JSON: {response.text[:200]}...")
+                complete = self._read_body(response)
+            finally:
+                # Returns the connection to the pool, or drops it if the body was cut short
+                response.close()
+            response_time = time.perf_counter() - start_time
 
-            result = APICheckResult(
-                endpoint=full_url,
-                method=method.upper(),
+            success = response.status_code == expected_status
+            if actuator:
+                if success and not complete:
+                    # A cut-off body cannot be decoded, so the health details are unknown
+                    success = False
+                    error_message = f"Response body exceeds {self.max_body_bytes} bytes"
+                else:
+                    error_message = None if success else f"HTTP {response.status_code}: {response.text}"
+                response_body = response.json() if success else None
+            else:
+                response_body = self._safe_json(response) if complete and parse_body else None
+                error_message = None if success else f"Expected {expected_status}, got {response.status_code}"
+
+            logger.info("%s check completed - Status: %s, Expected: %s, Time: %.2fs",
+                        label, response.status_code, expected_status, response_time)
+            return APICheckResult(
+                endpoint=url,
+                method=method,
                 status_code=response.status_code,
                 response_time=response_time,
                 success=success,
                 response_body=response_body,
-                error_message=None if success else f"Expected {expected_status}, got {response.status_code}"
+                error_message=error_message
             )
 
-            logger.info(f"API check completed - Status: {response.status_code}, Expected: {expected_status}, Time: {response_time:.2f}s")
-            return result
-
         except requests.exceptions.RequestException as e:
-            response_time = time.time() - start_time
-            logger.error(f"API check failed: {str(e)}")
+            response_time = time.perf_counter() - start_time
+            logger.error("%s check failed: %s", label, e)
             return APICheckResult(
-                endpoint=full_url,
-                method=method.upper(),
+                endpoint=url,
+                method=method,
                 status_code=0,
                 response_time=response_time,
                 success=False,
                 error_message=str(e)
             )
 
+    def check_many(self, endpoints: List[Union[str, Dict[str, Any]]],
+                   max_workers: int = 10) -> BatchResults:
+        """
+        Check several API endpoints concurrently
+
+        Args:
+            endpoints: Endpoints to check, either as a path/URL string or as a
+                dictionary of keyword arguments for check_custom_api
+            max_workers: Maximum number of requests in flight at once; capped
+                at pool_maxsize so every request gets a reusable connection
+
+        Returns:
+            BatchResults in the same order as endpoints
+        """
+        batch = BatchResults(len(endpoints))
+        if not endpoints:
+            return batch
+
+        logger.info("Checking %d API endpoints concurrently", len(endpoints))
+
+        # More workers than pooled connections would open sockets that the
+        # pool then discards instead of keeping alive
+        workers = min(max_workers, self.pool_maxsize, len(endpoints))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for index, endpoint in enumerate(endpoints):
+                kwargs = {'endpoint': endpoint} if isinstance(endpoint, str) else endpoint
+                futures[executor.submit(self.check_custom_api, **kwargs)] = index
+
+            # Store results as they complete, at their original position
+            for future in as_completed(futures):
+                batch.set(futures[future], future.result())
+
+        return batch
+
     def check_deployment_status(self, module_name: str) -> ModuleHealthStatus:
         """
         Comprehensive deployment status check for a module
@@ -243,13 +653,14 @@ class SpringActuatorChecker:
         Returns:
             ModuleHealthStatus with complete health information
         """
-        logger.info(f"Starting comprehensive deployment check for module: {module_name}")
+        logger.info("Starting comprehensive deployment check for module: %s", module_name)
 
-        # Check actuator health
-        health_result = self.check_actuator_health()
-
-        # Check actuator info
-        info_result = self.check_actuator_info()
+        # Check actuator health and info concurrently; both are network bound
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            health_future = executor.submit(self.check_actuator_health)
+            info_future = executor.submit(self.check_actuator_info)
+            health_result = health_future.result()
+            info_result = info_future.result()
 
         # Determine overall deployment status
         deployment_status = "UNKNOWN"
@@ -270,7 +681,7 @@ class SpringActuatorChecker:
             timestamp=datetime.now()
         )
 
-        logger.info(f"Deployment check completed for {module_name} - Status: {deployment_status}")
+        logger.info("Deployment check completed for %s - Status: %s", module_name, deployment_status)
         return module_status
 
     def validate_request_response_contract(self, endpoint: str, method: str = "GET",
@@ -284,16 +695,24 @@ class SpringActuatorChecker:
             endpoint: API endpoint to test
             method: HTTP method
             request_data: Expected request structure
-            expected_response_schema: Expected response structure
+            expected_response_schema: Expected response structure, mapping field
+                names to type names or to nested schemas for object fields
             headers: Additional headers to send with the request
 
         Returns:
             Dictionary with contract validation results
         """
-        logger.info(f"Validating contract for {method} {endpoint}")
+        logger.info("Validating contract for %s %s", method, endpoint)
 
         # Make the API call
-        api_result = self.check_custom_api(endpoint, method, headers=headers, json_data=request_data)
+        # The body only needs decoding if there is a schema to check it against
+        api_result = self.check_custom_api(
+            endpoint,
+            method,
+            headers=headers,
+            json_data=request_data,
+            parse_body=bool(expected_response_schema)
+        )
 
         contract_result = {
             "endpoint": endpoint,
@@ -314,20 +733,17 @@ class SpringActuatorChecker:
             response_body = api_result.response_body
 
             # Check if response has expected structure
-            for key, expected_type in expected_response_schema.items():
-                if key not in response_body:
-                    contract_result["errors"].append(f"Missing expected field: {key}")
-                else:
-                    actual_type = type(response_body[key]).__name__
-                    if actual_type != expected_type:
-                        contract_result["errors"].append(
-                            f"Type mismatch for {key}: expected {expected_type}, got {actual_type}"
-                        )
+            if not isinstance(response_body, dict):
+                contract_result["errors"].append(
+                    f"Expected JSON object response, got {type(response_body).__name__}"
+                )
+            else:
+                _validate_schema(response_body, expected_response_schema, contract_result["errors"])
 
         # If no errors, contract is valid
         contract_result["contract_valid"] = len(contract_result["errors"]) == 0
 
-        logger.info(f"Contract validation completed - Valid: {contract_result['contract_valid']}")
+        logger.info("Contract validation completed - Valid: %s", contract_result['contract_valid'])
         return contract_result
 
 def main():
@@ -353,7 +769,7 @@ def main():
         try:
             json_data = json.loads(args.api_data)
         except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON data: {e}")
+            logger.error("Invalid JSON data: %s", e)
             sys.exit(1)
 
     # Initialize checker
@@ -363,9 +779,20 @@ def main():
         verify_ssl=not args.no_ssl_verify
     )
 
-    # Run comprehensive deployment check
-    logger.info(f"Starting deployment check for module: {args.module}")
-    module_status = checker.check_deployment_status(args.module)
+    # Run comprehensive deployment check, alongside the additional API check if requested
+    logger.info("Starting deployment check for module: %s", args.module)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = executor.submit(checker.check_deployment_status, args.module)
+        api_future = None
+        if args.api_endpoint:
+            api_future = executor.submit(
+                checker.check_custom_api,
+                args.api_endpoint,
+                args.api_method,
+                json_data=json_data
+            )
+        module_status = status_future.result()
+        api_result = api_future.result() if api_future else None
 
     # Print results
     print(f"\n{'='*60}")
@@ -378,18 +805,12 @@ def main():
     print(f"\nActuator Health Details:")
     print(json.dumps(module_status.actuator_health, indent=2))
 
-    # Check additional API if provided
-    if args.api_endpoint:
+    # Report additional API check if provided
+    if api_result:
         print(f"\n{'-'*40}")
         print(f"ADDITIONAL API CHECK")
         print(f"{'-'*40}")
 
-        api_result = checker.check_custom_api(
-            args.api_endpoint,
-            args.api_method,
-            json_data=json_data
-        )
-
         print(f"Endpoint: {api_result.endpoint}")
         print(f"Method: {api_result.method}")
         print(f"Status Code: {api_result.status_code}")
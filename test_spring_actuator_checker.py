@@ -4,420 +4,727 @@ Test script for Spring Actuator Checker
 Tests the core functionality without requiring a live Spring Boot application
 """
 
-import unittest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import ANY, Mock, patch, MagicMock
 import json
 import sys
-import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from types import SimpleNamespace
 
-# Add the current directory to the path so we can import our module
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import pytest
 
 from spring_actuator_checker import (
     SpringActuatorChecker,
     APICheckResult,
+    BatchResults,
     ModuleHealthStatus
 )
 
 
-class TestSpringActuatorChecker(unittest.TestCase):
-    """Test cases for SpringActuatorChecker"""
-
-    def setUp(self):
-        """Set up test fixtures"""
-        self.base_url = "https://test-app.com"
-        self.checker = SpringActuatorChecker(
-            base_url=self.base_url,
-            timeout=10,
-            verify_ssl=False
-        )
-
-    def test_initialization(self):
-        """Test that the checker initializes correctly"""
-        self.assertEqual(self.checker.base_url, self.base_url)
-        self.assertEqual(self.checker.timeout, 10)
-        self.assertFalse(self.checker.verify_ssl)
-        self.assertIsNotNone(self.checker.session)
-
-    @patch('spring_actuator_checker.requests.Session.get')
-    def test_check_actuator_health_success(self, mock_get):
-        """Test successful actuator health check"""
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "status": "UP",
-            "components": {
-                "diskSpace": {"status": "UP"},
-                "ping": {"status": "UP"}
-            }
-        }
-        mock_get.return_value = mock_response
-
-        result = self.checker.check_actuator_health()
-
-        # Verify the result
-        self.assertTrue(result.success)
-        self.assertEqual(result.status_code, 200)
-        self.assertEqual(result.endpoint, f"{self.base_url}/actuator/health")
-        self.assertEqual(result.method, "GET")
-        self.assertIsNotNone(result.response_body)
-        self.assertIsNone(result.error_message)
-        self.assertGreaterEqual(result.response_time, 0)
-
-    @patch('spring_actuator_checker.requests.Session.get')
-    def test_check_actuator_health_failure(self, mock_get):
-        """Test failed actuator health check"""
-        # Mock failed response
-        mock_response = Mock()
-        mock_response.status_code = 503
-        mock_response.text = "Service Unavailable"
-        mock_get.return_value = mock_response
-
-        result = self.checker.check_actuator_health()
-
-        # Verify the result
-        self.assertFalse(result.success)
-        self.assertEqual(result.status_code, 503)
-        self.assertIsNone(result.response_body)
-        self.assertIsNotNone(result.error_message)
-
-    @patch('spring_actuator_checker.requests.Session.get')
-    def test_check_actuator_info_success(self, mock_get):
-        """Test successful actuator info check"""
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "app": {
-                "name": "test-app",
-                "version": "1.0.0",
-                "description": "Test application"
-            }
-        }
-        mock_get.return_value = mock_response
-
-        result = self.checker.check_actuator_info()
-
-        # Verify the result
-        self.assertTrue(result.success)
-        self.assertEqual(result.status_code, 200)
-        self.assertEqual(result.endpoint, f"{self.base_url}/actuator/info")
-        self.assertIsNotNone(result.response_body)
-
-    @patch('spring_actuator_checker.requests.Session.request')
-    def test_check_custom_api_post_success(self, mock_request):
-        """Test successful custom API check with POST method"""
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"id": 123, "name": "Test User"}
-        mock_request.return_value = mock_response
-
-        test_data = {"name": "Test User", "email": "test@example.com"}
-        result = self.checker.check_custom_api(
-            endpoint="/api/users",
-            method="POST",
-            json_data=test_data,
-            expected_status=201
-        )
-
-        # Verify the result
-        self.assertTrue(result.success)
-        self.assertEqual(result.status_code, 201)
-        self.assertEqual(result.method, "POST")
-        self.assertEqual(result.endpoint, f"{self.base_url}/api/users")
-        self.assertIsNotNone(result.response_body)
-
-        # Verify the request was made correctly
-        mock_request.assert_called_once()
-        call_args = mock_request.call_args
-        self.assertEqual(call_args[1]['method'], 'POST')
-        self.assertEqual(call_args[1]['json'], test_data)
-
-    @patch('spring_actuator_checker.requests.Session.request')
-    def test_check_custom_api_with_headers(self, mock_request):
-        """Test custom API check with additional headers"""
-        # Mock response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"message": "success"}
-        mock_request.return_value = mock_response
-
-        custom_headers = {"Authorization": "Bearer token123"}
-        result = self.checker.check_custom_api(
-            endpoint="/api/protected",
-            headers=custom_headers
-        )
-
-        # Verify headers were passed correctly
-        call_args = mock_request.call_args
-        request_headers = call_args[1]['headers']
-        self.assertIn("Authorization", request_headers)
-        self.assertEqual(request_headers["Authorization"], "Bearer token123")
-
-    def test_deployment_status_healthy(self):
-        """Test deployment status when both health and info are successful"""
-        # Mock the health and info check methods
-        with patch.object(self.checker, 'check_actuator_health') as mock_health, \
-             patch.object(self.checker, 'check_actuator_info') as mock_info:
-
-            # Mock successful responses
-            health_result = APICheckResult(
-                endpoint=f"{self.base_url}/actuator/health",
-                method="GET",
-                status_code=200,
-                response_time=0.1,
-                success=True,
-                response_body={"status": "UP"}
-            )
-            info_result = APICheckResult(
-                endpoint=f"{self.base_url}/actuator/info",
-                method="GET",
-                status_code=200,
-                response_time=0.1,
-                success=True,
-                response_body={"app": {"name": "test"}}
-            )
+BASE_URL = "https://test-app.com"
+HEALTH_URL = f"{BASE_URL}/actuator/health"
+INFO_URL = f"{BASE_URL}/actuator/info"
+API_TEST_URL = f"{BASE_URL}/api/test"
+
+# Response bodies and schemas shared by the tests; never mutate them
+HEALTH_UP_BODY = {"status": "UP"}
+HEALTH_DETAILS_BODY = {
+    "status": "UP",
+    "components": {
+        "diskSpace": {"status": "UP"},
+        "ping": {"status": "UP"}
+    }
+}
+INFO_BODY = {
+    "app": {
+        "name": "test-app",
+        "version": "1.0.0",
+        "description": "Test application"
+    }
+}
+MESSAGE_BODY = {"message": "success"}
+USERS_BODY = {
+    "users": [
+        {"id": 1, "name": "John"},
+        {"id": 2, "name": "Jane"}
+    ],
+    "totalCount": 2
+}
+USERS_SCHEMA = {"users": "list", "totalCount": "int"}
+
+# Raised by mocked Response.json() for non-JSON bodies; built once and reused
+_JSON_ERR = json.JSONDecodeError("Not JSON", "", 0)
+
+
+@pytest.fixture(scope="module")
+def session():
+    """Mock session injected into checkers, so no connection pool is built"""
+    return MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def _reset_session(session):
+    """Clear calls, return values and side effects left by the previous test"""
+    session.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def checker(session):
+    """Checker shared by the module; caching is off so tests stay independent"""
+    return SpringActuatorChecker(
+        base_url=BASE_URL,
+        timeout=10,
+        verify_ssl=False,
+        cache_ttl=0,
+        session=session
+    )
+
+
+@pytest.fixture(scope="module")
+def healthy_health_result():
+    """Successful actuator health result; shared read-only across tests"""
+    return APICheckResult(
+        endpoint=HEALTH_URL,
+        method="GET",
+        status_code=200,
+        response_time=0.1,
+        success=True,
+        response_body=HEALTH_UP_BODY
+    )
+
+
+@pytest.fixture(scope="module")
+def healthy_info_result():
+    """Successful actuator info result; shared read-only across tests"""
+    return APICheckResult(
+        endpoint=INFO_URL,
+        method="GET",
+        status_code=200,
+        response_time=0.1,
+        success=True,
+        response_body=INFO_BODY
+    )
+
+
+@pytest.fixture(scope="module")
+def failed_health_result():
+    """Failed actuator health result; shared read-only across tests"""
+    return APICheckResult(
+        endpoint=HEALTH_URL,
+        method="GET",
+        status_code=503,
+        response_time=0.1,
+        success=False,
+        error_message="Service Unavailable"
+    )
+
+
+@pytest.fixture
+def mock_request(session):
+    """The injected session's request method, which every check goes through"""
+    return session.request
+
+
+def make_response(status_code=200, body=None, chunks=(b"{}",), text=""):
+    """
+    Build a lightweight stand-in for a streamed requests.Response
+
+    A SimpleNamespace carries only what the checker touches, which is much
+    cheaper than a spec'd or autospec'd Mock. json and close stay Mocks so
+    tests can assert on them; without a body, json() raises like it would
+    for a non-JSON response.
+    """
+    return SimpleNamespace(
+        status_code=status_code,
+        url=BASE_URL,
+        text=text,
+        content=b"".join(chunks),
+        iter_content=lambda chunk_size: iter(chunks),
+        json=Mock(return_value=body) if body is not None else Mock(side_effect=_JSON_ERR),
+        close=Mock()
+    )
+
+
+# SpringActuatorChecker
+
+
+def test_initialization(checker, session):
+    """Test that the checker initializes correctly"""
+    assert checker.base_url == BASE_URL
+    assert checker.timeout == 10
+    assert not checker.verify_ssl
+    assert checker.session is session
+
+
+def test_default_session_headers():
+    """Test that a checker without an injected session sets JSON headers"""
+    checker = SpringActuatorChecker(base_url=BASE_URL)
+
+    assert checker.session.headers["Accept"] == "application/json"
+    assert "gzip" in checker.session.headers["Accept-Encoding"]
+
+
+def test_session_uses_pooled_adapter():
+    """Test that both schemes share one tuned connection pool adapter"""
+    checker = SpringActuatorChecker(base_url=BASE_URL)
+    https_adapter = checker.session.get_adapter(BASE_URL)
+    http_adapter = checker.session.get_adapter("http://test-app.com")
+
+    assert https_adapter is http_adapter
+    assert https_adapter.max_retries.total == 2
+    assert https_adapter.max_retries.connect == 0
+    assert https_adapter.max_retries.status_forcelist == (502, 504)
+    assert not https_adapter.max_retries.is_retry("GET", 503, has_retry_after=True)
+    assert not https_adapter.max_retries.is_retry("GET", 429, has_retry_after=True)
+    assert not https_adapter.max_retries.raise_on_status
+    assert https_adapter._pool_maxsize == 64
 
-            mock_health.return_value = health_result
-            mock_info.return_value = info_result
 
-            # Test the deployment status
-            module_status = self.checker.check_deployment_status("test-module")
+@patch('spring_actuator_checker.ThreadPoolExecutor', wraps=ThreadPoolExecutor)
+def test_check_many_limited_to_pool_size(mock_executor, mock_request, session):
+    """Test that batch concurrency never exceeds the connection pool size"""
+    checker = SpringActuatorChecker(base_url=BASE_URL, pool_maxsize=2, session=session)
+    mock_response = make_response(body={})
+    mock_request.return_value = mock_response
+
+    results = checker.check_many(["/api/a", "/api/b", "/api/c"], max_workers=8)
+
+    assert len(results) == 3
+    mock_executor.assert_called_once_with(max_workers=2)
+
+
+@patch('spring_actuator_checker.requests.Session.close')
+def test_context_manager_closes_session(mock_close):
+    """Test that leaving the with-block closes the session"""
+    with SpringActuatorChecker(base_url=BASE_URL):
+        mock_close.assert_not_called()
+
+    mock_close.assert_called_once()
+
+
+def test_close_leaves_injected_session_open(checker, session):
+    """Test that an injected session is left for its owner to close"""
+    checker.close()
+
+    session.close.assert_not_called()
+
+
+@pytest.mark.parametrize("method,endpoint,status_code,body,ok", [
+    ("check_actuator_health", HEALTH_URL, 200, HEALTH_DETAILS_BODY, True),
+    ("check_actuator_health", HEALTH_URL, 503, None, False),
+    ("check_actuator_info", INFO_URL, 200, INFO_BODY, True),
+])
+def test_check_actuator(mock_request, checker, method, endpoint, status_code, body, ok):
+    """Test actuator health and info checks against healthy and failing responses"""
+    if ok:
+        mock_response = make_response(status_code=status_code, body=body)
+    else:
+        mock_response = make_response(status_code=status_code, chunks=[b"Service Unavailable"], text="Service Unavailable")
+    mock_request.return_value = mock_response
+
+    result = getattr(checker, method)()
+
+    # Verify the result
+    assert result.success is ok
+    assert result.status_code == status_code
+    assert result.endpoint == endpoint
+    assert result.method == "GET"
+    assert result.response_time >= 0
+    if ok:
+        assert result.response_body == body
+        assert result.error_message is None
+    else:
+        assert result.response_body is None
+        assert result.error_message is not None
+
+
+def test_check_actuator_health_cached(mock_request, session):
+    """Test that a successful health result is reused within the cache TTL"""
+    checker = SpringActuatorChecker(base_url=BASE_URL, cache_ttl=60, session=session)
+    mock_response = make_response(body=HEALTH_UP_BODY)
+    mock_request.return_value = mock_response
+
+    first = checker.check_actuator_health()
+    second = checker.check_actuator_health()
+
+    assert first is second
+    mock_request.assert_called_once()
+
+    checker.clear_cache()
+    checker.check_actuator_health()
+    assert mock_request.call_count == 2
+
+
+def test_check_actuator_health_failure_not_cached(mock_request, session):
+    """Test that failed health results are always re-checked"""
+    checker = SpringActuatorChecker(base_url=BASE_URL, cache_ttl=60, session=session)
+    mock_response = make_response(status_code=503, chunks=[b"Service Unavailable"], text="Service Unavailable")
+    mock_request.return_value = mock_response
+
+    checker.check_actuator_health()
+    checker.check_actuator_health()
+
+    assert mock_request.call_count == 2
+
+
+def test_check_actuator_health_cache_disabled(mock_request, checker):
+    """Test that a zero TTL disables the actuator cache"""
+    mock_response = make_response(body=HEALTH_UP_BODY)
+    mock_request.return_value = mock_response
+
+    checker.check_actuator_health()
+    checker.check_actuator_health()
+
+    assert mock_request.call_count == 2
+
+
+def test_check_custom_api_post_success(mock_request, checker):
+    """Test successful custom API check with POST method"""
+    # Mock response
+    mock_response = make_response(status_code=201, body={"id": 123, "name": "Test User"})
+    mock_request.return_value = mock_response
+
+    test_data = {"name": "Test User", "email": "test@example.com"}
+    result = checker.check_custom_api(
+        endpoint="/api/users",
+        method="POST",
+        json_data=test_data,
+        expected_status=201
+    )
+
+    # Verify the result
+    assert result.success
+    assert result.status_code == 201
+    assert result.method == "POST"
+    assert result.endpoint == f"{BASE_URL}/api/users"
+    assert result.response_body is not None
+
+    # Verify the request was made correctly
+    mock_request.assert_called_once_with(
+        method="POST",
+        url=f"{BASE_URL}/api/users",
+        headers=ANY,
+        json=test_data,
+        stream=True,
+        timeout=10,
+        verify=False
+    )
+
+
+def test_check_custom_api_with_headers(mock_request, checker):
+    """Test custom API check with additional headers"""
+    # Mock response
+    mock_response = make_response(body=MESSAGE_BODY)
+    mock_request.return_value = mock_response
+
+    custom_headers = {"Authorization": "Bearer token123"}
+    checker.check_custom_api(
+        endpoint="/api/protected",
+        headers=custom_headers
+    )
+
+    # Verify headers were passed correctly
+    mock_request.assert_called_once_with(
+        method="GET",
+        url=f"{BASE_URL}/api/protected",
+        headers=custom_headers,
+        json=None,
+        stream=True,
+        timeout=10,
+        verify=False
+    )
+
+
+def test_check_many_preserves_order(mock_request, checker):
+    """Test that batch checks return one result per endpoint, in order"""
+    mock_response = make_response(body=MESSAGE_BODY)
+    mock_request.return_value = mock_response
+
+    results = checker.check_many([
+        "/api/first",
+        {"endpoint": "/api/second", "method": "POST", "json_data": {"id": 1}},
+        "/api/third"
+    ])
+
+    assert [result.endpoint for result in results] == [
+        f"{BASE_URL}/api/first", f"{BASE_URL}/api/second", f"{BASE_URL}/api/third"
+    ]
+    assert results[1].method == "POST"
+    assert all(result.success for result in results)
+    assert mock_request.call_count == 3
 
-            # Verify results
-            self.assertEqual(module_status.module_name, "test-module")
-            self.assertEqual(module_status.deployment_status, "HEALTHY")
-            self.assertEqual(module_status.overall_status, "HEALTHY")
-            self.assertEqual(len(module_status.api_checks), 2)
-            self.assertIsNotNone(module_status.timestamp)
 
-    def test_deployment_status_down(self):
-        """Test deployment status when health check fails"""
-        # Mock the health and info check methods
-        with patch.object(self.checker, 'check_actuator_health') as mock_health, \
-             patch.object(self.checker, 'check_actuator_info') as mock_info:
+def test_concurrent_identical_gets_share_one_request(monkeypatch, mock_request, checker):
+    """Test that identical in-flight GET checks are coalesced into one request"""
+    release = threading.Event()
+    mock_response = make_response(body=MESSAGE_BODY)
 
-            # Mock failed health response
-            health_result = APICheckResult(
-                endpoint=f"{self.base_url}/actuator/health",
-                method="GET",
-                status_code=503,
-                response_time=0.1,
-                success=False,
-                error_message="Service Unavailable"
-            )
-            info_result = APICheckResult(
-                endpoint=f"{self.base_url}/actuator/info",
-                method="GET",
-                status_code=200,
-                response_time=0.1,
-                success=True,
-                response_body={"app": {"name": "test"}}
-            )
+    class JoinSignallingFuture(Future):
+        # Only joining callers wait on the in-flight future, so this fires
+        # once a second check has attached to the first one's request
+        def result(self, timeout=None):
+            release.set()
+            return super().result(timeout)
 
-            mock_health.return_value = health_result
-            mock_info.return_value = info_result
+    def slow_request(**kwargs):
+        release.wait(timeout=5)
+        return mock_response
 
-            # Test the deployment status
-            module_status = self.checker.check_deployment_status("test-module")
+    monkeypatch.setattr("spring_actuator_checker.Future", JoinSignallingFuture)
+    mock_request.side_effect = slow_request
 
-            # Verify results
-            self.assertEqual(module_status.deployment_status, "DOWN")
-            self.assertEqual(module_status.overall_status, "DOWN")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(checker.check_custom_api, "/api/slow")
+        second = executor.submit(checker.check_custom_api, "/api/slow")
 
-    def test_validate_contract_success(self):
-        """Test successful contract validation"""
-        # Mock the custom API check
-        with patch.object(self.checker, 'check_custom_api') as mock_api:
+        assert first.result() is second.result()
 
-            # Mock successful API response
-            api_result = APICheckResult(
-                endpoint=f"{self.base_url}/api/test",
-                method="GET",
-                status_code=200,
-                response_time=0.1,
-                success=True,
-                response_body={
-                    "users": [
-                        {"id": 1, "name": "John"},
-                        {"id": 2, "name": "Jane"}
-                    ],
-                    "totalCount": 2
-                }
-            )
-            mock_api.return_value = api_result
-
-            # Define expected schema
-            expected_schema = {
-                "users": "list",
-                "totalCount": "int"
-            }
-
-            # Test contract validation
-            contract_result = self.checker.validate_request_response_contract(
-                endpoint="/api/test",
-                expected_response_schema=expected_schema
-            )
+    mock_request.assert_called_once()
+
+
+def test_posts_are_not_coalesced(mock_request, checker):
+    """Test that non-idempotent checks always send their own request"""
+    mock_response = make_response(status_code=201, body={"id": 1})
+    mock_request.return_value = mock_response
+
+    checker.check_many([
+        {"endpoint": "/api/users", "method": "POST", "json_data": {"name": "A"}, "expected_status": 201},
+        {"endpoint": "/api/users", "method": "POST", "json_data": {"name": "A"}, "expected_status": 201}
+    ])
+
+    assert mock_request.call_count == 2
+
+
+def test_get_with_empty_body_is_not_coalesced_with_no_body(mock_request, checker):
+    """Test that json_data={} and json_data=None count as different requests"""
+    barrier = threading.Barrier(2, timeout=5)
+    mock_response = make_response(body=MESSAGE_BODY)
+
+    def slow_request(**kwargs):
+        # Breaks (and fails the check) unless both requests are sent
+        barrier.wait()
+        return mock_response
+
+    mock_request.side_effect = slow_request
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(checker.check_custom_api, "/api/test", json_data=body)
+                   for body in ({}, None)]
+        results = [future.result() for future in futures]
+
+    assert all(result.success for result in results)
+    assert mock_request.call_count == 2
+    assert {call[1]["json"] is None for call in mock_request.call_args_list} == {True, False}
+
+
+def test_get_with_unserializable_key_parts_is_sent(mock_request, checker):
+    """Test that bytes headers or a non-JSON body never break request coalescing"""
+    mock_request.return_value = make_response(body=MESSAGE_BODY)
+
+    with_bytes_header = checker.check_custom_api("/api/test", headers={"X-Token": b"abc"})
+    with_object_body = checker.check_custom_api("/api/test", json_data={"when": object()})
+
+    assert with_bytes_header.success
+    assert with_object_body.success
+    assert mock_request.call_count == 2
 
-            # Verify results
-            self.assertTrue(contract_result["contract_valid"])
-            self.assertEqual(len(contract_result["errors"]), 0)
-            self.assertEqual(contract_result["endpoint"], "/api/test")
-            self.assertEqual(contract_result["method"], "GET")
 
-    def test_validate_contract_failure(self):
-        """Test failed contract validation"""
-        # Mock the custom API check
-        with patch.object(self.checker, 'check_custom_api') as mock_api:
+def test_deployment_status_healthy(monkeypatch, checker, healthy_health_result, healthy_info_result):
+    """Test deployment status when both health and info are successful"""
+    # Mock the health and info check methods
+    monkeypatch.setattr(checker, "check_actuator_health", Mock(return_value=healthy_health_result))
+    monkeypatch.setattr(checker, "check_actuator_info", Mock(return_value=healthy_info_result))
 
-            # Mock API response missing expected fields
-            api_result = APICheckResult(
-                endpoint=f"{self.base_url}/api/test",
+    # Test the deployment status
+    module_status = checker.check_deployment_status("test-module")
+
+    # Verify results
+    assert module_status.module_name == "test-module"
+    assert module_status.deployment_status == "HEALTHY"
+    assert module_status.overall_status == "HEALTHY"
+    assert len(module_status.api_checks) == 2
+    assert module_status.timestamp is not None
+
+
+def test_deployment_status_down(monkeypatch, checker, failed_health_result, healthy_info_result):
+    """Test deployment status when health check fails"""
+    # Mock the health and info check methods
+    monkeypatch.setattr(checker, "check_actuator_health", Mock(return_value=failed_health_result))
+    monkeypatch.setattr(checker, "check_actuator_info", Mock(return_value=healthy_info_result))
+
+    # Test the deployment status
+    module_status = checker.check_deployment_status("test-module")
+
+    # Verify results
+    assert module_status.deployment_status == "DOWN"
+    assert module_status.overall_status == "DOWN"
+
+
+def test_deployment_status_runs_checks_concurrently(monkeypatch, checker):
+    """Test that health and info checks are in flight at the same time"""
+    barrier = threading.Barrier(2, timeout=5)
+
+    def make_check(url):
+        def check():
+            # Deadlocks (and times out) unless both checks run in parallel
+            barrier.wait()
+            return APICheckResult(
+                endpoint=url,
                 method="GET",
                 status_code=200,
                 response_time=0.1,
                 success=True,
-                response_body={
-                    "users": [
-                        {"id": 1, "name": "John"}
-                    ]
-                    # Missing totalCount field
-                }
-            )
-            mock_api.return_value = api_result
-
-            # Define expected schema
-            expected_schema = {
-                "users": "list",
-                "totalCount": "int"  # This field is missing from response
-            }
-
-            # Test contract validation
-            contract_result = self.checker.validate_request_response_contract(
-                endpoint="/api/test",
-                expected_response_schema=expected_schema
+                response_body={}
             )
+        return check
+
+    monkeypatch.setattr(checker, "check_actuator_health", make_check(HEALTH_URL))
+    monkeypatch.setattr(checker, "check_actuator_info", make_check(INFO_URL))
+    module_status = checker.check_deployment_status("test-module")
+
+    assert module_status.deployment_status == "HEALTHY"
+
+
+@pytest.mark.parametrize("status_code,response_body,schema,expect_valid,expect_error", [
+    # Response matches the schema
+    (200, USERS_BODY, USERS_SCHEMA, True, None),
+    # Response is missing totalCount
+    (200, {"users": [{"id": 1, "name": "John"}]}, USERS_SCHEMA, False,
+     "Missing expected field: totalCount"),
+    # Response body is not a JSON object
+    (200, None, {"users": "list"}, False, "Expected JSON object response, got NoneType"),
+    # API call itself fails
+    (500, None, None, False, "API call failed"),
+])
+def test_validate_contract(monkeypatch, checker, status_code, response_body, schema,
+                           expect_valid, expect_error):
+    """Test contract validation outcomes for matching, mismatching and failed responses"""
+    api_result = APICheckResult(
+        endpoint=API_TEST_URL,
+        method="GET",
+        status_code=status_code,
+        response_time=0.1,
+        success=status_code == 200,
+        response_body=response_body,
+        error_message=None if status_code == 200 else "Internal Server Error"
+    )
+    monkeypatch.setattr(checker, "check_custom_api", Mock(return_value=api_result))
+
+    contract_result = checker.validate_request_response_contract(
+        endpoint="/api/test",
+        expected_response_schema=schema
+    )
+
+    # Verify results
+    assert contract_result["contract_valid"] is expect_valid
+    assert contract_result["endpoint"] == "/api/test"
+    assert contract_result["method"] == "GET"
+    if expect_error is None:
+        assert contract_result["errors"] == []
+    else:
+        assert any(expect_error in error for error in contract_result["errors"])
+
+
+def test_validate_contract_nested_schema(monkeypatch, checker):
+    """Test contract validation descends into nested object schemas"""
+    monkeypatch.setattr(checker, "check_custom_api", Mock(return_value=APICheckResult(
+        endpoint=API_TEST_URL,
+        method="GET",
+        status_code=200,
+        response_time=0.1,
+        success=True,
+        response_body={"app": {"name": "test-app", "version": 1}}
+    )))
+
+    contract_result = checker.validate_request_response_contract(
+        endpoint="/api/test",
+        expected_response_schema={
+            "app": {"name": "str", "version": "str", "description": "str"}
+        }
+    )
 
-            # Verify results
-            self.assertFalse(contract_result["contract_valid"])
-            self.assertGreater(len(contract_result["errors"]), 0)
-            self.assertIn("Missing expected field: totalCount", contract_result["errors"])
+    assert not contract_result["contract_valid"]
+    assert contract_result["errors"] == [
+        "Type mismatch for app.version: expected str, got int",
+        "Missing expected field: app.description"
+    ]
 
-    def test_validate_contract_api_failure(self):
-        """Test contract validation when API call fails"""
-        # Mock the custom API check
-        with patch.object(self.checker, 'check_custom_api') as mock_api:
 
-            # Mock failed API response
-            api_result = APICheckResult(
-                endpoint=f"{self.base_url}/api/test",
-                method="GET",
-                status_code=500,
-                response_time=0.1,
-                success=False,
-                error_message="Internal Server Error"
-            )
-            mock_api.return_value = api_result
+def test_check_custom_api_non_json_response(mock_request, checker):
+    """Test custom API check with non-JSON response"""
+    # Mock response that raises JSON decode error
+    mock_response = make_response(chunks=[b"<html>Not JSON response</html>"])
+    mock_response.text = "<html>Not JSON response</html>"
+    mock_request.return_value = mock_response
+
+    result = checker.check_custom_api("/api/html-endpoint")
+
+    # Verify the result handles non-JSON gracefully
+    assert result.success
+    assert result.status_code == 200
+    assert result.response_body is None  # Should be None for non-JSON
+
+
+def test_validate_contract_without_schema_skips_decoding(mock_request, checker):
+    """Test that contract validation without a schema never decodes the body"""
+    mock_response = make_response(chunks=[b'{"message": "success"}'])
+    mock_request.return_value = mock_response
+
+    contract_result = checker.validate_request_response_contract(endpoint="/api/test")
+
+    assert contract_result["contract_valid"]
+    mock_response.json.assert_not_called()
 
-            # Test contract validation
-            contract_result = self.checker.validate_request_response_contract(
-                endpoint="/api/test"
-            )
 
-            # Verify results
-            self.assertFalse(contract_result["contract_valid"])
-            self.assertIn("API call failed", contract_result["errors"][0])
+def test_check_custom_api_empty_response(mock_request, checker):
+    """Test that an empty body is not handed to the JSON decoder"""
+    mock_response = make_response(status_code=204, chunks=[])
+    mock_request.return_value = mock_response
 
-    @patch('spring_actuator_checker.requests.Session.request')
-    def test_check_custom_api_non_json_response(self, mock_request):
-        """Test custom API check with non-JSON response"""
-        # Mock response that raises JSON decode error
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = json.JSONDecodeError("Not JSON", "", 0)
-        mock_response.text = "<html>Not JSON response</html>"
-        mock_request.return_value = mock_response
+    result = checker.check_custom_api("/api/items/1", method="DELETE", expected_status=204)
 
-        result = self.checker.check_custom_api("/api/html-endpoint")
+    assert result.success
+    assert result.response_body is None
+    mock_response.json.assert_not_called()
 
-        # Verify the result handles non-JSON gracefully
-        self.assertTrue(result.success)
-        self.assertEqual(result.status_code, 200)
-        self.assertIsNone(result.response_body)  # Should be None for non-JSON
 
+def test_check_custom_api_oversized_response(mock_request, session):
+    """Test that bodies larger than max_body_bytes are cut off and not decoded"""
+    checker = SpringActuatorChecker(base_url=BASE_URL, max_body_bytes=16, session=session)
+    mock_response = make_response(chunks=[b'{"data": "', b"x" * 64, b'"}'])
+    mock_request.return_value = mock_response
 
-class TestAPICheckResult(unittest.TestCase):
-    """Test cases for APICheckResult data class"""
+    result = checker.check_custom_api("/api/large")
 
-    def test_api_check_result_creation(self):
-        """Test APICheckResult can be created with all fields"""
-        result = APICheckResult(
-            endpoint="https://test.com/api",
+    assert result.success
+    assert result.response_body is None
+    assert len(mock_response._content) == 16
+    mock_response.json.assert_not_called()
+    mock_response.close.assert_called_once()
+    assert mock_request.call_args[1]['stream']
+
+
+def test_check_actuator_health_oversized_response_fails(mock_request, session):
+    """Test that an actuator body larger than max_body_bytes fails the check"""
+    checker = SpringActuatorChecker(base_url=BASE_URL, max_body_bytes=16, cache_ttl=0, session=session)
+    mock_response = make_response(body=HEALTH_DETAILS_BODY, chunks=[b'{"status": "UP", ', b"x" * 64, b'}'])
+    mock_request.return_value = mock_response
+
+    result = checker.check_actuator_health()
+
+    assert not result.success
+    assert result.status_code == 200
+    assert result.response_body is None
+    assert result.error_message == "Response body exceeds 16 bytes"
+    mock_response.json.assert_not_called()
+
+
+# Dataclasses
+
+
+@pytest.mark.parametrize("cls,kwargs", [
+    (APICheckResult, {
+        "endpoint": "https://test.com/api",
+        "method": "GET",
+        "status_code": 200,
+        "response_time": 0.5,
+        "success": True,
+        "response_body": {"test": "data"},
+        "error_message": None
+    }),
+    (ModuleHealthStatus, {
+        "module_name": "test-module",
+        "overall_status": "HEALTHY",
+        "actuator_health": HEALTH_UP_BODY,
+        "api_checks": [],
+        "deployment_status": "HEALTHY",
+        "timestamp": datetime.now()
+    }),
+])
+def test_dataclass_roundtrip(cls, kwargs):
+    """Test the result dataclasses keep every field they are built with"""
+    instance = cls(**kwargs)
+
+    for name, value in kwargs.items():
+        assert getattr(instance, name) == value
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses need Python 3.10+")
+def test_api_check_result_has_no_instance_dict():
+    """Test APICheckResult uses slots instead of a per-instance __dict__"""
+    result = APICheckResult(
+        endpoint="https://test.com/api",
+        method="GET",
+        status_code=200,
+        response_time=0.5,
+        success=True
+    )
+
+    assert not hasattr(result, "__dict__")
+
+
+# BatchResults
+
+
+@pytest.fixture
+def batch():
+    """A batch of ten checks with response times 0.1s .. 1.0s, the last two failing"""
+    batch = BatchResults(10)
+    for i in range(10):
+        batch.set(i, APICheckResult(
+            endpoint=f"https://test.com/api/{i}",
             method="GET",
-            status_code=200,
-            response_time=0.5,
-            success=True,
-            response_body={"test": "data"},
-            error_message=None
-        )
-
-        self.assertEqual(result.endpoint, "https://test.com/api")
-        self.assertEqual(result.method, "GET")
-        self.assertEqual(result.status_code, 200)
-        self.assertEqual(result.response_time, 0.5)
-        self.assertTrue(result.success)
-        self.assertEqual(result.response_body, {"test": "data"})
-        self.assertIsNone(result.error_message)
-
-
-class TestModuleHealthStatus(unittest.TestCase):
-    """Test cases for ModuleHealthStatus data class"""
-
-    def test_module_health_status_creation(self):
-        """Test ModuleHealthStatus can be created with all fields"""
-        from datetime import datetime
-
-        status = ModuleHealthStatus(
-            module_name="test-module",
-            overall_status="HEALTHY",
-            actuator_health={"status": "UP"},
-            api_checks=[],
-            deployment_status="HEALTHY",
-            timestamp=datetime.now()
-        )
-
-        self.assertEqual(status.module_name, "test-module")
-        self.assertEqual(status.overall_status, "HEALTHY")
-        self.assertEqual(status.deployment_status, "HEALTHY")
-        self.assertIsNotNone(status.timestamp)
-
-
-def run_tests():
-    """Run all tests"""
-    # Create test suite
-    test_classes = [
-        TestSpringActuatorChecker,
-        TestAPICheckResult,
-        TestModuleHealthStatus
+            status_code=200 if i < 8 else 500,
+            response_time=(i + 1) / 10,
+            success=i < 8,
+            error_message=None if i < 8 else "Expected 200, got 500"
+        ))
+    return batch
+
+
+def test_batch_aggregates(batch):
+    """Test success rate, percentiles and slowest checks"""
+    assert batch.success_rate() == pytest.approx(0.8)
+    assert batch.p50() == pytest.approx(0.5)
+    assert batch.p99() == pytest.approx(1.0)
+    assert [endpoint for endpoint, _ in batch.slowest(2)] == [
+        "https://test.com/api/9", "https://test.com/api/8"
     ]
 
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
 
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
+def test_batch_to_objects_round_trip(batch):
+    """Test that stored checks materialize back into APICheckResult objects"""
+    results = list(batch.to_objects())
+
+    assert len(results) == 10
+    assert results[9].status_code == 500
+    assert not results[9].success
+    assert results[9].error_message == "Expected 200, got 500"
+    assert batch[0].endpoint == "https://test.com/api/0"
+
+
+def test_batch_slicing(batch):
+    """Test that slicing a batch yields a list of per-check results"""
+    tail = batch[7:]
+
+    assert [result.endpoint for result in tail] == [f"https://test.com/api/{i}" for i in range(7, 10)]
+    assert [result.success for result in tail] == [True, False, False]
+    assert [result.status_code for result in batch[::-4]] == [500, 200, 200]
+    assert batch[-1].status_code == 500
+
 
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+def test_empty_batch():
+    """Test aggregates on an empty batch"""
+    batch = BatchResults(0)
 
-    return result.wasSuccessful()
+    assert len(batch) == 0
+    assert batch.started_at is not None
+    assert batch.success_rate() == 0.0
+    assert batch.slowest() == []
+    with pytest.raises(ValueError):
+        batch.p50()
 
 
 if __name__ == "__main__":
-    success = run_tests()
-    if not success:
-        sys.exit(1)
+    sys.exit(pytest.main([__file__, "-q"]))